@@ -4,18 +4,24 @@ from fastapi import (
     HTTPException,
     status,
     Response,
-    BackgroundTasks
+    BackgroundTasks,
+    Query,
+    Request
 )
+from fastapi.responses import PlainTextResponse
 from .database import create_pool
+from .profiling import profile_for, is_profiling, PROFILE_MAX_SECONDS
+from core.tracing import span
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
 import sys
 import os
-from security.jwt_auth import validate_token
+from security.jwt_auth import validate_token, require_admin
 import uuid
 import asyncio
+import time
 from functools import lru_cache
 from asyncio import Semaphore
 from contextlib import asynccontextmanager
@@ -52,15 +58,20 @@ class TaskManager:
     @classmethod
     @asynccontextmanager
     async def get_connection(cls):
-        async with cls._sem:
-            if not cls._pool:
-                cls._pool = await create_pool()  # Your DB pool creation
-            try:
-                async with cls._pool.acquire() as conn:
-                    yield conn
-            except Exception as e:
-                print(f"Connection error: {e}")
-                raise
+        with span("task_manager.get_connection") as s:
+            started = time.perf_counter()
+            async with cls._sem:
+                s.set_attribute(
+                    "semaphore_wait_ms", (time.perf_counter() - started) * 1000
+                )
+                if not cls._pool:
+                    cls._pool = await create_pool()  # Your DB pool creation
+                try:
+                    async with cls._pool.acquire() as conn:
+                        yield conn
+                except Exception as e:
+                    print(f"Connection error: {e}")
+                    raise
 
     @staticmethod
     async def create(task_data: TaskSchema) -> Dict[str, Any]:
@@ -73,9 +84,10 @@ class TaskManager:
 class WebSocketBroker:
     @classmethod
     async def broadcast(cls, event_type: str, payload: dict):
-        # await redis.publish('task_events', json.dumps(payload))
-        # Implement actual messaging system
-        pass
+        with span("broker.broadcast", event_type=event_type):
+            # await redis.publish('task_events', json.dumps(payload))
+            # Implement actual messaging system
+            pass
 
 
 class TaskBatch:
@@ -95,23 +107,29 @@ class TaskBatch:
         }
 
     async def add(self, task: Dict[str, Any], retry_count: int = 0):
-        async with self._lock:
-            priority = PriorityLevel(task.get('priority', PriorityLevel.LOW))
-            task['retry_count'] = retry_count
-            self.priority_queues[priority].append(task)
-            
-            if sum(len(q) for q in self.priority_queues.values()) >= self.max_size:
-                await self.process()
+        with span("task_batch.add", retry_count=retry_count) as s:
+            started = time.perf_counter()
+            async with self._lock:
+                s.set_attribute(
+                    "lock_wait_ms", (time.perf_counter() - started) * 1000
+                )
+                priority = PriorityLevel(task.get('priority', PriorityLevel.LOW))
+                task['retry_count'] = retry_count
+                self.priority_queues[priority].append(task)
+
+                if sum(len(q) for q in self.priority_queues.values()) >= self.max_size:
+                    await self.process()
 
     async def process(self):
-        for priority in PriorityLevel:
-            queue = self.priority_queues[priority]
-            if queue:
-                try:
-                    await self._process_batch(queue, priority)
-                except Exception as e:
-                    await self._handle_batch_error(queue, priority, e)
-                queue.clear()
+        with span("task_batch.process"):
+            for priority in PriorityLevel:
+                queue = self.priority_queues[priority]
+                if queue:
+                    try:
+                        await self._process_batch(queue, priority)
+                    except Exception as e:
+                        await self._handle_batch_error(queue, priority, e)
+                    queue.clear()
 
     async def _handle_batch_error(self, batch: list, priority: PriorityLevel, error: Exception):
         delay = self.retry_delays[priority]
@@ -122,20 +140,32 @@ class TaskBatch:
             else:
                 print(f"Task {task['id']} failed after 3 retries: {error}")
 
-    async def _process_batch(self, batch):
-        try:
-            await asyncio.gather(*[
-                WebSocketBroker.broadcast("TASK_CREATED", task) 
-                for task in batch
-            ])
-        except Exception as e:
-            print(f"Batch processing error: {e}")
+    async def _process_batch(self, batch: list, priority: PriorityLevel):
+        with span(
+            "task_batch.broadcast", priority=priority.value, size=len(batch)
+        ):
+            try:
+                await asyncio.gather(*[
+                    WebSocketBroker.broadcast("TASK_CREATED", task)
+                    for task in batch
+                ])
+            except Exception as e:
+                print(f"Batch processing error: {e}")
 
 
 task_batch = TaskBatch()
 
 
-router = APIRouter()
+async def trace_request(request: Request):
+    # Runs before the endpoint's own dependencies, so auth and the handler
+    # share this request's trace.
+    with span(
+        "http.request", method=request.method, path=request.url.path
+    ):
+        yield
+
+
+router = APIRouter(dependencies=[Depends(trace_request)])
 
 
 @lru_cache(maxsize=100)
@@ -152,8 +182,9 @@ async def create_task(
     token_data: Dict = Depends(validate_token)
 ):
     try:
-        task = await TaskManager.create(task_data)
-        await task_batch.add(task)
+        with span("tasks.create", priority=task_data.priority.value):
+            task = await TaskManager.create(task_data)
+            await task_batch.add(task)
         
         response.headers.update({
             "Cache-Control": "private, max-age=3600",
@@ -169,5 +200,19 @@ async def create_task(
         ) from e
 
 
+@router.post("/admin/profile", response_class=PlainTextResponse)
+async def capture_profile(
+    seconds: int = Query(10, ge=1, le=PROFILE_MAX_SECONDS),
+    token_data: Dict = Depends(require_admin)
+):
+    """Sample the live process and return collapsed stacks for flamegraphs"""
+    if is_profiling():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already being captured"
+        )
+    return PlainTextResponse(await profile_for(seconds))
+
+
 def update_metrics(task):
     pass  # Implement metric tracking logic here
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Dict, Optional
+
+
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", 0.005))
+PROFILE_MAX_SECONDS = int(os.getenv("PROFILE_MAX_SECONDS", 60))
+
+
+class SamplingProfiler:
+    """Sample every thread's stack and aggregate them in collapsed format"""
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("Profiler already started")
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> str:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        """Render stacks as `frame;frame;frame count` lines for flamegraph tools"""
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self._stacks.most_common()
+        )
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = self._thread_names()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                root = names.get(thread_id, str(thread_id))
+                self._stacks[self._fold(root, frame)] += 1
+            self.samples += 1
+
+    @staticmethod
+    def _thread_names() -> Dict[int, str]:
+        return {t.ident: t.name for t in threading.enumerate()}
+
+    @staticmethod
+    def _fold(root: str, frame: Optional[FrameType]) -> str:
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append(
+                f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                f":{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+        frames.append(root)
+        return ";".join(reversed(frames))
+
+
+_profile_lock = asyncio.Lock()
+
+
+def is_profiling() -> bool:
+    return _profile_lock.locked()
+
+
+async def profile_for(
+    seconds: float, interval: float = PROFILE_INTERVAL
+) -> str:
+    """Profile the running process for `seconds` without blocking the loop"""
+    seconds = min(seconds, PROFILE_MAX_SECONDS)
+    async with _profile_lock:
+        profiler = SamplingProfiler(interval)
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile = await asyncio.to_thread(profiler.stop)
+        return profile
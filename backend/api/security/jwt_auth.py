@@ -7,6 +7,7 @@ import os
 from datetime import datetime, timedelta
 from redis import Redis
 import secrets
+from core.tracing import span
 
 
 security = HTTPBearer()
@@ -22,6 +23,13 @@ redis_client = Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
 RATE_LIMIT_WINDOW = 900  # 15 minutes in seconds
 MAX_REQUESTS = 100
 
+# Users allowed to call admin diagnostics such as /admin/profile
+PROFILE_ADMIN_USER_IDS = frozenset(
+    user_id.strip()
+    for user_id in os.getenv("PROFILE_ADMIN_USER_IDS", "").split(",")
+    if user_id.strip()
+)
+
 
 class TokenValidator:
     def __init__(self):
@@ -87,10 +95,14 @@ class TokenValidator:
 
         self._cache_misses += 1
         try:
-            payload = jwt.decode(
-                token, secret_key, algorithms=[JWT_ALGORITHM]
-            )
-            is_blacklisted = await redis_client.get(f"blacklist:{token}")
+            with span("auth.jwt_decode"):
+                payload = jwt.decode(
+                    token, secret_key, algorithms=[JWT_ALGORITHM]
+                )
+            with span("auth.blacklist_lookup"):
+                is_blacklisted = await redis_client.get(
+                    f"blacklist:{token}"
+                )
 
             if is_blacklisted:
                 raise HTTPException(
@@ -159,6 +171,11 @@ def create_refresh_token(data: dict) -> str:
 async def validate_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> Dict:
+    with span("auth.validate_token"):
+        return await _validate_token(credentials)
+
+
+async def _validate_token(credentials: HTTPAuthorizationCredentials) -> Dict:
     try:
         if not credentials:
             raise HTTPException(
@@ -176,9 +193,10 @@ async def validate_token(
             )
 
         try:
-            payload = await token_validator.validate_and_decode_token(
-                token, secret_key
-            )
+            with span("auth.validate_and_decode"):
+                payload = await token_validator.validate_and_decode_token(
+                    token, secret_key
+                )
         except ExpiredSignatureError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -190,7 +208,9 @@ async def validate_token(
                 detail="Invalid token",
             )
 
-        if not token_validator.check_rate_limit(payload["user_id"]):
+        with span("auth.rate_limit"):
+            allowed = token_validator.check_rate_limit(payload["user_id"])
+        if not allowed:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded",
@@ -204,6 +224,15 @@ async def validate_token(
         )
 
 
+async def require_admin(token_data: Dict = Depends(validate_token)) -> Dict:
+    if token_data.get("user_id") not in PROFILE_ADMIN_USER_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return token_data
+
+
 async def refresh_access_token(
     refresh_token: str, background_tasks: BackgroundTasks
 ) -> Dict:
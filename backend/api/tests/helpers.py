@@ -0,0 +1,81 @@
+import importlib
+import importlib.util
+import os
+import sys
+import types
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+
+BACKEND_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+ORCHESTRATOR_PATH = os.path.join(BACKEND_DIR, "core", "1.2.1_ai_orchestrator.py")
+TEST_JWT_SECRET = "test-secret-key-with-at-least-32-bytes"
+
+# business_routes imports `security.jwt_auth` relative to backend/api
+for _path in (os.path.join(BACKEND_DIR, "api"), BACKEND_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+
+class FakeRedis:
+    def __init__(self):
+        self._data: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self._data[key] = value
+
+
+class FakePool:
+    @asynccontextmanager
+    async def acquire(self):
+        yield object()
+
+
+async def create_pool() -> FakePool:
+    return FakePool()
+
+
+class StubTextGenerator:
+    """Callable shaped like a transformers text-generation pipeline"""
+
+    def __call__(self, prompt: str, **kwargs):
+        return [{"generated_text": f"{prompt} Follow up."}]
+
+
+def load_business_routes():
+    """Import business_routes with an in-memory DB pool and Redis"""
+    os.environ.setdefault("JWT_SECRET_KEY", TEST_JWT_SECRET)
+    jwt_auth = importlib.import_module("security.jwt_auth")
+    jwt_auth.redis_client = FakeRedis()
+    jwt_auth.token_validator = jwt_auth.TokenValidator()
+
+    if "api.database" not in sys.modules:
+        try:
+            importlib.import_module("api.database")
+        except ModuleNotFoundError:
+            database = types.ModuleType("api.database")
+            database.create_pool = create_pool
+            sys.modules["api.database"] = database
+
+    routes = importlib.import_module("api.business_routes")
+    routes.TaskManager._pool = FakePool()
+    return routes, jwt_auth
+
+
+def load_orchestrator():
+    """Load AIOrchestrator (needs torch and transformers) with a stub model"""
+    spec = importlib.util.spec_from_file_location(
+        "ai_orchestrator", ORCHESTRATOR_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    orchestrator = module.AIOrchestrator()
+    orchestrator.nlp = StubTextGenerator()
+    orchestrator.is_initialized = True
+    return orchestrator
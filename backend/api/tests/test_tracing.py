@@ -0,0 +1,171 @@
+import asyncio
+import importlib.util
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+from fastapi import BackgroundTasks, FastAPI
+from fastapi.testclient import TestClient
+
+from api.profiling import SamplingProfiler, profile_for
+from api.tests.helpers import load_business_routes, load_orchestrator
+from core.tests.test_tracing import SpanFileTestCase
+
+
+HAS_MODEL_DEPS = all(
+    importlib.util.find_spec(name) for name in ("torch", "transformers")
+)
+
+
+class TestPipelineSpans(SpanFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.routes, self.jwt_auth = load_business_routes()
+        app = FastAPI()
+        app.include_router(self.routes.router)
+        self.app = app
+
+    def auth_headers(self, **claims):
+        token = self.jwt_auth.create_access_token({"user_id": "u1", **claims})
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_post_tasks_shares_one_trace(self):
+        client = TestClient(self.app)
+        with patch.object(self.routes.task_batch, "max_size", 1):
+            response = client.post(
+                "/tasks",
+                json={"description": "Trace me", "priority": "HIGH"},
+                headers=self.auth_headers()
+            )
+        self.assertEqual(response.status_code, 200)
+
+        spans = self.read_spans()
+        self.assertEqual(
+            {s["trace_id"] for s in spans.values()},
+            {spans["http.request"]["trace_id"]}
+        )
+        self.assertIsNone(spans["http.request"]["parent_id"])
+        self.assertParent(spans, "auth.validate_token", "http.request")
+        self.assertParent(spans, "auth.validate_and_decode", "auth.validate_token")
+        self.assertParent(spans, "auth.jwt_decode", "auth.validate_and_decode")
+        self.assertParent(spans, "auth.blacklist_lookup", "auth.validate_and_decode")
+        self.assertParent(spans, "auth.rate_limit", "auth.validate_token")
+        self.assertParent(spans, "tasks.create", "http.request")
+        self.assertParent(spans, "task_manager.get_connection", "tasks.create")
+        self.assertParent(spans, "task_batch.add", "tasks.create")
+        self.assertParent(spans, "task_batch.process", "task_batch.add")
+        self.assertParent(spans, "task_batch.broadcast", "task_batch.process")
+        self.assertParent(spans, "broker.broadcast", "task_batch.broadcast")
+        self.assertIn(
+            "semaphore_wait_ms",
+            spans["task_manager.get_connection"]["attributes"]
+        )
+        self.assertIn("lock_wait_ms", spans["task_batch.add"]["attributes"])
+
+    def test_profile_requires_admin_user(self):
+        client = TestClient(self.app)
+        with patch.object(
+            self.jwt_auth, "PROFILE_ADMIN_USER_IDS", frozenset({"admin-1"})
+        ):
+            response = client.post(
+                "/admin/profile?seconds=1",
+                headers=self.auth_headers(role="admin")
+            )
+        self.assertEqual(response.status_code, 403)
+
+    async def test_concurrent_profiles_conflict(self):
+        # A refreshed token must keep admin access
+        refresh_token = self.jwt_auth.create_refresh_token(
+            {"user_id": "admin-1"}
+        )
+        refreshed = await self.jwt_auth.refresh_access_token(
+            refresh_token, BackgroundTasks()
+        )
+        headers = {"Authorization": f"Bearer {refreshed['access_token']}"}
+
+        transport = httpx.ASGITransport(app=self.app)
+        with patch.object(
+            self.jwt_auth, "PROFILE_ADMIN_USER_IDS", frozenset({"admin-1"})
+        ):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                first = asyncio.create_task(
+                    client.post("/admin/profile?seconds=1", headers=headers)
+                )
+                await asyncio.sleep(0.2)
+                second = await client.post(
+                    "/admin/profile?seconds=1", headers=headers
+                )
+                first = await first
+
+        self.assertEqual(second.status_code, 409)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("MainThread;", first.text)
+
+    @unittest.skipUnless(HAS_MODEL_DEPS, "requires torch and transformers")
+    async def test_orchestrator_batch_spans(self):
+        orchestrator = load_orchestrator()
+        orchestrator.batch_size = 2
+        first = {"id": "t1", "description": "One"}
+        await orchestrator.add_to_batch(first)
+        self.assertEqual(orchestrator.batch_queue, [first])
+        await orchestrator.add_to_batch({"id": "t2", "description": "Two"})
+        self.assertEqual(orchestrator.batch_queue, [])
+
+        span_list = self.read_span_list()
+        spans = {s["name"]: s for s in span_list}
+        root = spans["orchestrator.process_batch"]
+        self.assertIsNone(root["parent_id"])
+        self.assertEqual(root["attributes"], {"size": 2})
+        for name in ("orchestrator.queue_wait", "orchestrator.process_task"):
+            children = [s for s in span_list if s["name"] == name]
+            self.assertEqual(len(children), 2)
+            for child in children:
+                self.assertEqual(child["parent_id"], root["span_id"])
+        self.assertParent(
+            spans, "orchestrator.format_prompt", "orchestrator.process_task"
+        )
+        self.assertParent(
+            spans, "orchestrator.inference", "orchestrator.process_task"
+        )
+
+
+class TestSamplingProfiler(unittest.IsolatedAsyncioTestCase):
+
+    def test_collapsed_stacks(self):
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+        profile = profiler.stop()
+
+        self.assertGreater(profiler.samples, 0)
+        stack, count = profile.splitlines()[0].rsplit(" ", 1)
+        self.assertTrue(stack.startswith("MainThread;"))
+        self.assertGreater(int(count), 0)
+        self.assertNotIn("sampling-profiler", profile)
+
+    async def test_profile_for_does_not_block_loop(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                sum(range(100000))
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        profile = await profile_for(0.1, interval=0.005)
+        task.cancel()
+
+        self.assertIn("ticker", profile)
+        self.assertGreater(ticks, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
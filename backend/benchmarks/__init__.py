@@ -0,0 +1,11 @@
+import os
+import sys
+
+
+# Benchmarks import the app the same way the server does: `api.*` from the
+# backend root and `security.*` from backend/api.
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for _path in (os.path.join(_BACKEND_DIR, "api"), _BACKEND_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
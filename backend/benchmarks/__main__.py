@@ -0,0 +1,137 @@
+import argparse
+import asyncio
+import importlib
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+from core import tracing
+
+from . import harness
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SUITES = {
+    "auth": "benchmarks.bench_auth",
+    "batching": "benchmarks.bench_batching",
+    "load": "benchmarks.bench_load",
+    "orchestrator": "benchmarks.bench_orchestrator",
+}
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run offline benchmarks and compare them to a baseline"
+    )
+    parser.add_argument(
+        "suites", nargs="*", metavar="SUITE",
+        help=f"Suites to run: {', '.join(SUITES)} (default: all)"
+    )
+    parser.add_argument(
+        "--output", default=os.path.join(BENCH_DIR, "results", "latest.json")
+    )
+    parser.add_argument(
+        "--baseline", default=os.path.join(BENCH_DIR, "baseline.json")
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=harness.DEFAULT_TOLERANCE,
+        help="Allowed relative slowdown before a metric counts as a regression"
+    )
+    parser.add_argument(
+        "--p99-tolerance", type=float,
+        default=harness.DEFAULT_P99_TOLERANCE,
+        help="Allowed relative slowdown for p99 latency"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=harness.DEFAULT_ROUNDS,
+        help="Timed rounds per benchmark; the fastest round is reported"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--update-baseline", action="store_true",
+        help="Store this run as the new baseline instead of comparing"
+    )
+    mode.add_argument(
+        "--no-compare", action="store_true",
+        help="Only record results; do not compare against the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+    args.suites = args.suites or list(SUITES)
+    return args
+
+
+async def run_suites(
+    names: List[str], rounds: int
+) -> List[Dict[str, Any]]:
+    # Keep span export I/O out of the measurements.
+    tracing.set_exporter(None)
+    random.seed(0)
+
+    results = []
+    for name in names:
+        module = importlib.import_module(SUITES[name])
+        print(f"Running {name} benchmarks...", file=sys.stderr)
+        results.extend(await module.run(rounds))
+    return results
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(run_suites(args.suites, args.rounds))
+    print(harness.format_table(results))
+
+    harness.save_results(results, args.output)
+    print(f"\nResults written to {args.output}")
+
+    if args.no_compare:
+        return 0
+
+    if args.update_baseline:
+        if os.path.exists(args.baseline):
+            merged = harness.load_results(args.baseline)
+            merged.update((r["name"], r) for r in results)
+            results = list(merged.values())
+        harness.save_results(results, args.baseline)
+        print(f"Baseline updated at {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(
+            f"No baseline at {args.baseline}; record one with "
+            "--update-baseline or pass --no-compare"
+        )
+        return 1
+
+    baseline = harness.load_results(args.baseline)
+    missing = [r["name"] for r in results if r["name"] not in baseline]
+    if missing:
+        print(
+            f"Not in baseline: {', '.join(missing)}; "
+            "record them with --update-baseline"
+        )
+
+    regressions = harness.compare(
+        results, baseline, args.tolerance, args.p99_tolerance
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"  {regression}")
+    if missing or regressions:
+        return 1
+
+    print(
+        f"No regressions (tolerance {args.tolerance:.0%}, "
+        f"p99 {args.p99_tolerance:.0%})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,54 @@
+from typing import Any, Dict, List
+
+from .fakes import BENCH_JWT_SECRET, load_jwt_auth
+from .harness import bench_async, bench_sync
+
+
+ITERATIONS = 5000
+WARMUP = 100
+# The rate limiter is fresh each round, so every user makes
+# ITERATIONS * 10 / USERS = 5 calls per round, far below MAX_REQUESTS.
+USERS = 10000
+
+
+async def run(rounds: int) -> List[Dict[str, Any]]:
+    jwt_auth = load_jwt_auth()
+    tokens = [
+        jwt_auth.create_access_token({"user_id": f"user-{i}"})
+        for i in range(WARMUP + rounds * ITERATIONS)
+    ]
+
+    cold = jwt_auth.TokenValidator()
+    warm = jwt_auth.TokenValidator()
+    await warm.validate_and_decode_token(tokens[0], BENCH_JWT_SECRET)
+    limiter = jwt_auth.TokenValidator()
+
+    def fresh_limiter() -> None:
+        nonlocal limiter
+        limiter = jwt_auth.TokenValidator()
+
+    def check_rate_limit(i: int) -> None:
+        if not limiter.check_rate_limit(f"user-{i % USERS}"):
+            raise RuntimeError("Rate limit hit; raise USERS for this run")
+
+    return [
+        await bench_async(
+            "auth.validate_and_decode_token.cold",
+            lambda i: cold.validate_and_decode_token(
+                tokens[i], BENCH_JWT_SECRET
+            ),
+            ITERATIONS, WARMUP, rounds
+        ),
+        await bench_async(
+            "auth.validate_and_decode_token.cached",
+            lambda i: warm.validate_and_decode_token(
+                tokens[0], BENCH_JWT_SECRET
+            ),
+            ITERATIONS, WARMUP, rounds
+        ),
+        bench_sync(
+            "auth.check_rate_limit",
+            check_rate_limit,
+            ITERATIONS * 10, WARMUP, rounds, setup=fresh_limiter
+        ),
+    ]
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List
+
+from .fakes import load_business_routes
+from .harness import bench_async
+
+
+ITERATIONS = 2000
+WARMUP = 100
+BATCH_SIZE = 100
+PRIORITIES = ("HIGH", "MEDIUM", "LOW")
+
+
+def make_task(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"task-{i}",
+        "description": f"Benchmark task {i}",
+        "priority": PRIORITIES[i % len(PRIORITIES)],
+    }
+
+
+async def run(rounds: int) -> List[Dict[str, Any]]:
+    routes, _ = load_business_routes()
+    # Emptied before each round and never reaches max_size, so `add` times
+    # the lock and append only; the flush is task_batch.process below.
+    add_batch = routes.TaskBatch(max_size=WARMUP + ITERATIONS * 10 + 1)
+
+    def empty_add_batch() -> None:
+        for queue in add_batch.priority_queues.values():
+            queue.clear()
+
+    process_batch = routes.TaskBatch(max_size=BATCH_SIZE)
+    batch = [make_task(i) for i in range(BATCH_SIZE)]
+
+    async def process(i: int) -> None:
+        for task in batch:
+            task["retry_count"] = 0
+            process_batch.priority_queues[
+                routes.PriorityLevel(task["priority"])
+            ].append(task)
+        await process_batch.process()
+
+    return [
+        await bench_async(
+            "task_batch.add",
+            lambda i: add_batch.add(make_task(i)),
+            ITERATIONS * 10, WARMUP, rounds, setup=empty_add_batch
+        ),
+        await bench_async(
+            f"task_batch.process.{BATCH_SIZE}",
+            process,
+            ITERATIONS // 10, WARMUP, rounds
+        ),
+        await bench_async(
+            "broker.broadcast",
+            lambda i: routes.WebSocketBroker.broadcast(
+                "TASK_CREATED", batch[i % BATCH_SIZE]
+            ),
+            ITERATIONS * 10, WARMUP, rounds
+        ),
+    ]
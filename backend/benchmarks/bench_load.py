@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI
+
+from .fakes import load_business_routes
+from .harness import calibrate, combine_rounds, summarize
+
+
+REQUESTS = 2000
+WARMUP = 50
+CONCURRENCY = 50
+USERS = 50
+
+
+async def run(rounds: int) -> List[Dict[str, Any]]:
+    routes, jwt_auth = load_business_routes()
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    headers = [
+        {"Authorization": "Bearer " + jwt_auth.create_access_token(
+            {"user_id": f"load-user-{i}"}
+        )}
+        for i in range(USERS)
+    ]
+    errors = 0
+
+    async def post_task(client: httpx.AsyncClient, i: int) -> float:
+        nonlocal errors
+        t0 = time.perf_counter()
+        response = await client.post(
+            "/tasks",
+            json={"description": f"Load task {i}", "priority": "MEDIUM"},
+            headers=headers[i % USERS]
+        )
+        if response.status_code != 200:
+            errors += 1
+        return time.perf_counter() - t0
+
+    async def load_round(client: httpx.AsyncClient) -> Dict[str, Any]:
+        # Fresh rate-limit and token-cache state, so every round starts equal
+        jwt_auth.token_validator = jwt_auth.TokenValidator()
+        for i in range(WARMUP):
+            await post_task(client, i)
+
+        pending = iter(range(WARMUP, WARMUP + REQUESTS))
+        durations: List[float] = []
+
+        async def worker() -> None:
+            for i in pending:
+                durations.append(await post_task(client, i))
+
+        calibration_ms = calibrate()
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(CONCURRENCY)])
+        return summarize(
+            f"load.post_tasks.c{CONCURRENCY}",
+            durations,
+            time.perf_counter() - started,
+            calibration_ms
+        )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        summaries = [await load_round(client) for _ in range(rounds)]
+
+    if errors:
+        raise RuntimeError(f"{errors} POST /tasks requests failed")
+
+    return [combine_rounds(summaries)]
@@ -0,0 +1,93 @@
+import importlib.util
+import os
+from typing import Any, Dict, List
+
+import torch
+
+from .harness import bench_async
+
+
+ITERATIONS = 500
+WARMUP = 20
+BATCH_SIZE = 10
+ORCHESTRATOR_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "core", "1.2.1_ai_orchestrator.py"
+)
+
+
+class TinyTextGenerator:
+    """Seeded byte-level model shaped like a transformers text-generation pipeline"""
+
+    def __init__(self, hidden_size: int = 32, new_tokens: int = 16):
+        torch.manual_seed(0)
+        self.new_tokens = new_tokens
+        self.embed = torch.nn.Embedding(256, hidden_size)
+        self.head = torch.nn.Linear(hidden_size, 256)
+
+    def __call__(self, prompt: str, max_length: int = 100, **kwargs):
+        ids = list(prompt.encode("utf-8"))
+        for _ in range(self.new_tokens):
+            context = torch.tensor(ids[-max_length:])
+            ids.append(int(self.head(self.embed(context).mean(0)).argmax()))
+        completion = bytes(ids[-self.new_tokens:]).decode("latin-1")
+        return [{"generated_text": prompt + completion}]
+
+
+def load_orchestrator():
+    spec = importlib.util.spec_from_file_location(
+        "ai_orchestrator", ORCHESTRATOR_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    orchestrator = module.AIOrchestrator()
+    orchestrator.nlp = TinyTextGenerator()
+    orchestrator.is_initialized = True
+    return orchestrator
+
+
+async def run(rounds: int) -> List[Dict[str, Any]]:
+    orchestrator = load_orchestrator()
+    orchestrator.batch_size = BATCH_SIZE
+
+    def make_task(i: int) -> Dict[str, Any]:
+        return {"id": f"task-{i}", "description": f"Review invoice #{i}"}
+
+    async def process(i: int) -> None:
+        result = await orchestrator.process_task(make_task(i))
+        if result["status"] != "processed":
+            raise RuntimeError(result["error"])
+
+    async def process_batch(i: int) -> None:
+        # The last add reaches batch_size and runs process_batch()
+        for n in range(BATCH_SIZE):
+            await orchestrator.add_to_batch(make_task(i * BATCH_SIZE + n))
+
+    process_results = [
+        await bench_async(
+            "orchestrator.process_task",
+            process,
+            ITERATIONS, WARMUP, rounds
+        ),
+        await bench_async(
+            f"orchestrator.process_batch.{BATCH_SIZE}",
+            process_batch,
+            ITERATIONS // BATCH_SIZE, WARMUP, rounds
+        ),
+    ]
+
+    # Emptied before each round and never reaches batch_size, so
+    # `add_to_batch` times the append only; the flush is process_batch above.
+    orchestrator.batch_size = WARMUP + ITERATIONS + 1
+
+    def empty_batch_queue() -> None:
+        orchestrator.batch_queue.clear()
+        orchestrator._enqueued_at.clear()
+
+    add_result = await bench_async(
+        "orchestrator.add_to_batch",
+        lambda i: orchestrator.add_to_batch(make_task(i)),
+        ITERATIONS, WARMUP, rounds, setup=empty_batch_queue
+    )
+    return [*process_results, add_result]
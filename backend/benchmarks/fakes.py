@@ -0,0 +1,58 @@
+import importlib
+import os
+import sys
+import types
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+
+BENCH_JWT_SECRET = "benchmark-secret-key-not-for-production-use"
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis calls made by jwt_auth"""
+
+    def __init__(self):
+        self._data: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self._data[key] = value
+
+
+class FakePool:
+    """Connection pool with the `acquire()` shape TaskManager expects"""
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield object()
+
+
+async def create_pool() -> FakePool:
+    return FakePool()
+
+
+def load_jwt_auth():
+    """Import jwt_auth as business_routes does and point it at FakeRedis"""
+    os.environ.setdefault("JWT_SECRET_KEY", BENCH_JWT_SECRET)
+    jwt_auth = importlib.import_module("security.jwt_auth")
+    jwt_auth.redis_client = FakeRedis()
+    return jwt_auth
+
+
+def load_business_routes():
+    """Import business_routes with an in-memory DB pool and Redis"""
+    jwt_auth = load_jwt_auth()
+    if "api.database" not in sys.modules:
+        try:
+            importlib.import_module("api.database")
+        except ModuleNotFoundError:
+            database = types.ModuleType("api.database")
+            database.create_pool = create_pool
+            sys.modules["api.database"] = database
+
+    routes = importlib.import_module("api.business_routes")
+    routes.TaskManager._pool = FakePool()
+    return routes, jwt_auth
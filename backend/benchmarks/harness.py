@@ -0,0 +1,225 @@
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+DEFAULT_TOLERANCE = float(os.getenv("BENCH_TOLERANCE", 0.3))
+# Tail latency is noisier than the median, so it gets a wider band.
+DEFAULT_P99_TOLERANCE = float(os.getenv("BENCH_P99_TOLERANCE", 1.0))
+DEFAULT_ROUNDS = int(os.getenv("BENCH_ROUNDS", 5))
+# Latency changes smaller than this are timer/scheduler noise, whatever
+# their relative size.
+MIN_LATENCY_DELTA_MS = float(os.getenv("BENCH_MIN_DELTA_MS", 0.01))
+
+# Metric name -> True when a larger value is better
+COMPARED_METRICS = {
+    "p50_ms": False,
+    "p99_ms": False,
+    "ops_per_sec": True,
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not samples:
+        raise ValueError("No samples to summarize")
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(
+    name: str,
+    durations: List[float],
+    wall_time: Optional[float] = None,
+    calibration_ms: Optional[float] = None
+) -> Dict[str, Any]:
+    wall_time = wall_time if wall_time is not None else sum(durations)
+    summary = {
+        "name": name,
+        "iterations": len(durations),
+        "mean_ms": sum(durations) / len(durations) * 1000,
+        "p50_ms": percentile(durations, 50) * 1000,
+        "p99_ms": percentile(durations, 99) * 1000,
+        "ops_per_sec": len(durations) / wall_time if wall_time else 0.0,
+    }
+    if calibration_ms is not None:
+        summary["calibration_ms"] = calibration_ms
+    return summary
+
+
+def _reference_workload() -> None:
+    table = {str(i): i for i in range(5000)}
+    sorted(table, key=table.__getitem__, reverse=True)
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Time a fixed pure-Python workload to gauge current machine speed"""
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _reference_workload()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def combine_rounds(rounds: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Report the round with the lowest mean latency
+
+    Noise only ever makes a round slower, so the fastest round is the most
+    repeatable. All metrics, including `iterations`, describe that one round.
+    """
+    fastest = min(rounds, key=lambda r: r["mean_ms"])
+    return {**fastest, "rounds": len(rounds)}
+
+
+def bench_sync(
+    name: str,
+    func: Callable[[int], Any],
+    iterations: int,
+    warmup: int = 100,
+    rounds: int = DEFAULT_ROUNDS,
+    setup: Optional[Callable[[], Any]] = None
+) -> Dict[str, Any]:
+    """Call `func(i)` with a distinct `i` for every warmup and timed call
+
+    `setup`, if given, runs untimed before each round to reset state.
+    """
+    for i in range(warmup):
+        func(i)
+
+    summaries = []
+    for start in range(warmup, warmup + rounds * iterations, iterations):
+        if setup is not None:
+            setup()
+        gc.collect()
+        calibration_ms = calibrate()
+        durations = []
+        started = time.perf_counter()
+        for i in range(start, start + iterations):
+            t0 = time.perf_counter()
+            func(i)
+            durations.append(time.perf_counter() - t0)
+        summaries.append(summarize(
+            name, durations, time.perf_counter() - started, calibration_ms
+        ))
+    return combine_rounds(summaries)
+
+
+async def bench_async(
+    name: str,
+    func: Callable[[int], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 100,
+    rounds: int = DEFAULT_ROUNDS,
+    setup: Optional[Callable[[], Any]] = None
+) -> Dict[str, Any]:
+    """Await `func(i)` with a distinct `i` for every warmup and timed call
+
+    `setup`, if given, runs untimed before each round to reset state.
+    """
+    for i in range(warmup):
+        await func(i)
+
+    summaries = []
+    for start in range(warmup, warmup + rounds * iterations, iterations):
+        if setup is not None:
+            setup()
+        gc.collect()
+        calibration_ms = calibrate()
+        durations = []
+        started = time.perf_counter()
+        for i in range(start, start + iterations):
+            t0 = time.perf_counter()
+            await func(i)
+            durations.append(time.perf_counter() - t0)
+        summaries.append(summarize(
+            name, durations, time.perf_counter() - started, calibration_ms
+        ))
+    return combine_rounds(summaries)
+
+
+def save_results(results: List[Dict[str, Any]], path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    report = {
+        "meta": {
+            "created": datetime.utcnow().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "benchmarks": {result["name"]: result for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["benchmarks"]
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    p99_tolerance: float = DEFAULT_P99_TOLERANCE,
+    min_latency_delta_ms: float = MIN_LATENCY_DELTA_MS
+) -> List[str]:
+    """Return one message per metric that regressed beyond `tolerance`
+
+    When both runs carry `calibration_ms`, the baseline is first scaled by
+    how much slower or faster the machine was, so host contention is not
+    reported as a regression.
+    """
+    tolerances = {
+        "p50_ms": tolerance,
+        "p99_ms": p99_tolerance,
+        "ops_per_sec": tolerance,
+    }
+    regressions = []
+    for result in results:
+        reference = baseline.get(result["name"])
+        if reference is None:
+            continue
+        speed = 1.0
+        if result.get("calibration_ms") and reference.get("calibration_ms"):
+            speed = result["calibration_ms"] / reference["calibration_ms"]
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            current, expected = result.get(metric), reference.get(metric)
+            if current is None or not expected:
+                continue
+            expected = expected / speed if higher_is_better else expected * speed
+            change = (current - expected) / expected
+            if higher_is_better:
+                change = -change
+            elif current - expected <= min_latency_delta_ms:
+                continue
+            if change > tolerances[metric]:
+                regressions.append(
+                    f"{result['name']}.{metric}: {current:.4f} vs baseline "
+                    f"{expected:.4f} ({change:+.0%} worse)"
+                )
+    return regressions
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    width = max(len(result["name"]) for result in results)
+    lines = [
+        f"{'benchmark':<{width}}  {'rounds':>6}  {'iters':>7}  {'p50 ms':>9}  "
+        f"{'p99 ms':>9}  {'ops/s':>11}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['name']:<{width}}  {result.get('rounds', 1):>6}  "
+            f"{result['iterations']:>7}  "
+            f"{result['p50_ms']:>9.4f}  {result['p99_ms']:>9.4f}  "
+            f"{result['ops_per_sec']:>11.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks import harness
+
+
+def result(name, p50=1.0, p99=2.0, ops=1000.0, **extra):
+    return {
+        "name": name,
+        "iterations": 100,
+        "mean_ms": p50,
+        "p50_ms": p50,
+        "p99_ms": p99,
+        "ops_per_sec": ops,
+        **extra,
+    }
+
+
+class TestHarness(unittest.TestCase):
+
+    def test_percentile_nearest_rank(self):
+        samples = list(range(1, 101))
+        self.assertEqual(harness.percentile(samples, 50), 50)
+        self.assertEqual(harness.percentile(samples, 99), 99)
+        self.assertEqual(harness.percentile([5], 99), 5)
+        with self.assertRaises(ValueError):
+            harness.percentile([], 50)
+
+    def test_summarize(self):
+        summary = harness.summarize("x", [0.001] * 99 + [0.1], wall_time=0.2)
+        self.assertEqual(summary["iterations"], 100)
+        self.assertAlmostEqual(summary["p50_ms"], 1.0)
+        self.assertAlmostEqual(summary["p99_ms"], 1.0)
+        self.assertAlmostEqual(summary["ops_per_sec"], 500.0)
+
+    def test_bench_sync_and_async(self):
+        calls = []
+        summary = harness.bench_sync(
+            "sync", calls.append, 50, warmup=5, rounds=3
+        )
+        self.assertEqual(summary["iterations"], 50)
+        self.assertEqual(summary["rounds"], 3)
+        self.assertEqual(calls, list(range(155)))
+        self.assertGreater(summary["calibration_ms"], 0)
+
+        resets = []
+        harness.bench_sync(
+            "setup", lambda i: None, 10, warmup=0, rounds=4,
+            setup=lambda: resets.append(True)
+        )
+        self.assertEqual(len(resets), 4)
+
+        async def sleep(i):
+            await asyncio.sleep(0)
+
+        summary = asyncio.run(
+            harness.bench_async("async", sleep, 20, warmup=0, rounds=2)
+        )
+        self.assertEqual(summary["name"], "async")
+        self.assertGreater(summary["ops_per_sec"], 0)
+
+    def test_combine_rounds_reports_one_whole_round(self):
+        slow = result("a", p50=2.0, p99=3.0, ops=500.0, calibration_ms=1.2)
+        fast = result("a", p50=1.0, p99=4.0, ops=900.0, calibration_ms=1.0)
+
+        combined = harness.combine_rounds([slow, fast, slow])
+
+        self.assertEqual(combined, {**fast, "rounds": 3})
+        self.assertEqual(combined["iterations"], 100)
+
+    def test_compare_flags_regressions_beyond_tolerance(self):
+        baseline = {"a": result("a"), "b": result("b"), "c": result("c")}
+        current = [
+            result("a", p50=1.2, p99=3.0, ops=850.0),
+            result("b", p50=1.5, ops=500.0),
+            result("c", p99=4.5),
+            result("new"),
+        ]
+
+        regressions = harness.compare(
+            current, baseline, tolerance=0.3, p99_tolerance=1.0
+        )
+
+        self.assertEqual(
+            [r.split(":")[0] for r in regressions],
+            ["b.p50_ms", "b.ops_per_sec", "c.p99_ms"]
+        )
+
+    def test_compare_ignores_sub_floor_latency_changes(self):
+        baseline = {"a": result("a", p50=0.0005, p99=0.001)}
+        current = [result("a", p50=0.002, p99=0.008)]
+        self.assertEqual(
+            harness.compare(current, baseline, min_latency_delta_ms=0.01), []
+        )
+        self.assertEqual(
+            len(harness.compare(current, baseline, min_latency_delta_ms=0)), 2
+        )
+
+    def test_compare_scales_baseline_by_calibration(self):
+        baseline = {"a": result("a", calibration_ms=1.0)}
+        contended = [
+            result("a", p50=1.9, p99=3.8, ops=520.0, calibration_ms=2.0)
+        ]
+        self.assertEqual(harness.compare(contended, baseline), [])
+
+        regressed = [
+            result("a", p50=1.9, p99=3.8, ops=520.0, calibration_ms=1.0)
+        ]
+        self.assertEqual(len(harness.compare(regressed, baseline)), 2)
+
+    def test_compare_ignores_improvements(self):
+        baseline = {"a": result("a")}
+        current = [result("a", p50=0.1, p99=0.2, ops=10000.0)]
+        self.assertEqual(harness.compare(current, baseline, 0.1), [])
+
+    def test_save_and_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results", "run.json")
+            harness.save_results([result("a")], path)
+
+            self.assertEqual(harness.load_results(path), {"a": result("a")})
+            with open(path, encoding="utf-8") as f:
+                self.assertIn("python", json.load(f)["meta"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@ import logging
 from contextlib import contextmanager
 import os
 import asyncio
+import time
+from core.tracing import span, record_span
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,7 @@ class AIOrchestrator:
         self.batch_size = int(os.getenv("MAX_BATCH_SIZE", 10))
         self.retry_limit = int(os.getenv("RETRY_LIMIT", 3))
         self.batch_queue = []
+        self._enqueued_at = {}  # task id -> perf_counter() at add_to_batch
         
     async def initialize(self):
         try:
@@ -41,10 +44,12 @@ class AIOrchestrator:
             await self.initialize()
 
         try:
-            prompt = self._format_prompt(task_data)
+            with span("orchestrator.format_prompt"):
+                prompt = self._format_prompt(task_data)
             
-            with torch.no_grad():
-                generated = self.nlp(prompt, max_length=100, do_sample=True)
+            with span("orchestrator.inference", prompt_chars=len(prompt)):
+                with torch.no_grad():
+                    generated = self.nlp(prompt, max_length=100, do_sample=True)
 
             return {
                 "task_id": task_data["id"],
@@ -63,6 +68,7 @@ class AIOrchestrator:
             }
 
     async def add_to_batch(self, task_data: Dict[str, Any]) -> None:
+        self._enqueued_at[task_data.get("id")] = time.perf_counter()
         self.batch_queue.append(task_data)
         if len(self.batch_queue) >= self.batch_size:
             await self.process_batch()
@@ -74,15 +80,24 @@ class AIOrchestrator:
         batch = self.batch_queue[:self.batch_size]
         self.batch_queue = self.batch_queue[self.batch_size:]
 
-        for task in batch:
-            for attempt in range(self.retry_limit):
-                try:
-                    result = await self.process_task(task)
-                    if result["status"] == "processed":
-                        break
-                except Exception as e:
-                    logger.error(f"Batch processing error: {e}")
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+        with span("orchestrator.process_batch", size=len(batch)):
+            for task in batch:
+                enqueued_at = self._enqueued_at.pop(task.get("id"), None)
+                if enqueued_at is not None:
+                    record_span(
+                        "orchestrator.queue_wait",
+                        time.perf_counter() - enqueued_at,
+                        task_id=task.get("id")
+                    )
+                for attempt in range(self.retry_limit):
+                    try:
+                        with span("orchestrator.process_task", attempt=attempt):
+                            result = await self.process_task(task)
+                        if result["status"] == "processed":
+                            break
+                    except Exception as e:
+                        logger.error(f"Batch processing error: {e}")
+                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
 
     def load_model(self, model_path: str) -> Optional[torch.jit.ScriptModule]:
         """Safely load PyTorch model with memory management"""
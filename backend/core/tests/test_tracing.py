@@ -0,0 +1,139 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from core import tracing
+
+
+class SpanFileTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        tracing.set_exporter(tracing.FileSpanExporter(self.path))
+
+    def tearDown(self):
+        tracing.set_exporter(None)
+        os.remove(self.path)
+
+    def read_span_list(self):
+        tracing.get_exporter().flush()
+        with open(self.path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def read_spans(self):
+        return {s["name"]: s for s in self.read_span_list()}
+
+    def assertParent(self, spans, child, parent):
+        self.assertEqual(
+            spans[child]["parent_id"], spans[parent]["span_id"],
+            f"{child} is not a child of {parent}"
+        )
+
+
+class TestTracing(SpanFileTestCase):
+
+    async def test_nested_spans_share_trace(self):
+        with tracing.span("outer", kind="test"):
+            with tracing.span("inner"):
+                await asyncio.sleep(0.01)
+
+        spans = self.read_spans()
+        self.assertEqual(spans["inner"]["parent_id"], spans["outer"]["span_id"])
+        self.assertEqual(spans["inner"]["trace_id"], spans["outer"]["trace_id"])
+        self.assertEqual(spans["outer"]["attributes"], {"kind": "test"})
+        self.assertGreaterEqual(spans["inner"]["duration_ms"], 10)
+
+    async def test_concurrent_tasks_keep_separate_parents(self):
+        async def work(name):
+            with tracing.span(name):
+                await asyncio.sleep(0)
+                with tracing.span(f"{name}.child"):
+                    await asyncio.sleep(0)
+
+        await asyncio.gather(work("a"), work("b"))
+
+        spans = self.read_spans()
+        self.assertEqual(spans["a.child"]["parent_id"], spans["a"]["span_id"])
+        self.assertEqual(spans["b.child"]["parent_id"], spans["b"]["span_id"])
+
+    def test_error_is_recorded(self):
+        with self.assertRaises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("boom")
+
+        span = self.read_spans()["failing"]
+        self.assertEqual(span["status"], "error")
+        self.assertIn("boom", span["attributes"]["error"])
+
+    def test_record_span(self):
+        with tracing.span("parent"):
+            tracing.record_span("queue_wait", 0.25, task_id="t1")
+
+        spans = self.read_spans()
+        self.assertEqual(spans["queue_wait"]["duration_ms"], 250)
+        self.assertEqual(
+            spans["queue_wait"]["parent_id"], spans["parent"]["span_id"]
+        )
+
+    def test_export_writes_off_the_calling_thread(self):
+        exporter = tracing.get_exporter()
+        writers = []
+        write = exporter._write
+
+        def record_writer(buffer):
+            if buffer:
+                writers.append(threading.current_thread().name)
+            write(buffer)
+
+        with patch.object(exporter, "_write", side_effect=record_writer):
+            with tracing.span("background"):
+                pass
+            exporter.flush()
+
+        self.assertEqual(writers, ["span-exporter"])
+        self.assertIn("background", self.read_spans())
+
+    def test_full_queue_drops_spans(self):
+        exporter = tracing.FileSpanExporter(
+            self.path, flush_every=1, max_queue=1
+        )
+        tracing.set_exporter(exporter)
+        release = threading.Event()
+        write = exporter._write
+
+        def blocked_write(buffer):
+            release.wait(5)
+            write(buffer)
+
+        with patch.object(exporter, "_write", side_effect=blocked_write):
+            with tracing.span("taken-by-writer"):
+                pass
+            time.sleep(0.05)
+            with tracing.span("queued"):
+                pass
+            with tracing.span("dropped"):
+                pass
+            self.assertEqual(exporter.dropped, 1)
+            release.set()
+            exporter.flush()
+
+        self.assertEqual(
+            set(self.read_spans()), {"taken-by-writer", "queued"}
+        )
+
+    def test_disabled_exporter_is_noop(self):
+        tracing.set_exporter(None)
+        with tracing.span("ignored") as s:
+            s.set_attribute("key", "value")
+        tracing.record_span("ignored", 1.0)
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
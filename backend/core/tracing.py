@@ -0,0 +1,207 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH")
+TRACE_FLUSH_EVERY = int(os.getenv("TRACE_FLUSH_EVERY", 100))
+TRACE_FLUSH_INTERVAL = float(os.getenv("TRACE_FLUSH_INTERVAL", 1.0))
+TRACE_QUEUE_SIZE = int(os.getenv("TRACE_QUEUE_SIZE", 10000))
+
+
+class Span:
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id",
+        "attributes", "status", "start", "duration_ms", "_t0"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes or {}
+        self.status = "ok"
+        self.start = time.time()
+        self.duration_ms = 0.0
+        self._t0 = time.perf_counter()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        self.duration_ms = (time.perf_counter() - self._t0) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+class FileSpanExporter:
+    """Append finished spans to a file as JSON lines from a writer thread
+
+    Spans are dropped, and counted in `dropped`, when the writer falls more
+    than `max_queue` spans behind.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: str,
+        flush_every: int = TRACE_FLUSH_EVERY,
+        flush_interval: float = TRACE_FLUSH_INTERVAL,
+        max_queue: int = TRACE_QUEUE_SIZE
+    ):
+        self.path = path
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._reported_drops = 0
+        self._drop_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queue))
+        self._thread = threading.Thread(
+            target=self._run, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until every span exported so far is written"""
+        if not self._thread.is_alive():
+            return
+        written = threading.Event()
+        self._queue.put(written)
+        written.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        buffer: List[str] = []
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._write(buffer)
+                continue
+
+            if isinstance(item, Span):
+                buffer.append(json.dumps(item.to_dict(), default=str))
+                if len(buffer) >= self.flush_every:
+                    self._write(buffer)
+                continue
+
+            self._write(buffer)
+            if item is self._STOP:
+                return
+            item.set()
+
+    def _write(self, buffer: List[str]) -> None:
+        dropped = self.dropped
+        if dropped > self._reported_drops:
+            print(f"Span exporter queue full; {dropped} spans dropped so far")
+            self._reported_drops = dropped
+        if not buffer:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(buffer) + "\n")
+        except OSError as e:
+            print(f"Span export error: {e}")
+        buffer.clear()
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "current_span", default=None
+)
+_exporter: Optional[FileSpanExporter] = None
+
+
+def set_exporter(exporter: Optional[FileSpanExporter]) -> None:
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+    _exporter = exporter
+
+
+def get_exporter() -> Optional[FileSpanExporter]:
+    return _exporter
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Time the enclosed block as a child of the current span"""
+    exporter = _exporter
+    if exporter is None:
+        yield _NOOP_SPAN
+        return
+
+    current = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.attributes["error"] = repr(e)
+        raise
+    finally:
+        current.end()
+        _current_span.reset(token)
+        exporter.export(current)
+
+
+def record_span(name: str, duration: float, **attributes: Any) -> None:
+    """Export a span that already elapsed, e.g. time spent in a queue"""
+    exporter = _exporter
+    if exporter is None:
+        return
+
+    recorded = Span(name, _current_span.get(), attributes)
+    recorded.start -= duration
+    recorded.duration_ms = duration * 1000
+    exporter.export(recorded)
+
+
+if TRACE_EXPORT_PATH:
+    set_exporter(FileSpanExporter(TRACE_EXPORT_PATH))
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    if _exporter is not None:
+        _exporter.close()